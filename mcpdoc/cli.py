@@ -51,6 +51,9 @@ Examples:
   
   # Allow fetching from any domain
   mcpdoc --yaml sample_config.yaml --allowed-domains '*'
+
+  # Fetch all remote llms.txt files at once the first time one is needed
+  mcpdoc --yaml sample_config.yaml --prefetch-remote
 """
 
 
@@ -92,6 +95,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--timeout", type=float, default=10.0, help="HTTP request timeout in seconds"
     )
+    parser.add_argument(
+        "--prefetch-remote",
+        action="store_true",
+        help="Fetch all remote llms.txt files concurrently on the first request for one, to warm the cache",
+    )
     parser.add_argument(
         "--transport",
         type=str,
@@ -246,6 +254,7 @@ def main() -> None:
         timeout=args.timeout,
         settings=settings,
         allowed_domains=args.allowed_domains,
+        prefetch_remote=args.prefetch_remote,
     )
 
     if args.transport == "sse":
@@ -1,13 +1,46 @@
 """MCP Llms-txt server for docs."""
 
+import asyncio
+import functools
 import os
-from urllib.parse import urlparse
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from typing import Any
 
 import httpx
 from markdownify import markdownify
 from mcp.server.fastmcp import FastMCP
 from typing_extensions import NotRequired, TypedDict
 
+from mcpdoc.parsing import (
+    extract_domain,
+    iter_llms_urls,
+    parse_llms_urls,
+    split_scannable,
+)
+
+# Size of the text chunks read when streaming llms.txt files
+_LLMS_CHUNK_SIZE = 8192
+
+# HTML longer than this is converted to markdown in chunks of at most this size
+_MARKDOWNIFY_CHUNK_SIZE = 2_000_000
+# Closing tags after which a large HTML document is preferably split
+_HTML_BLOCK_ENDS = ("</p>", "</div>")
+# Size of the blocks read from local files
+_LOCAL_READ_SIZE = 65536
+
+# Documents that are already markdown (or plain text) are returned as is
+_MARKDOWN_CONTENT_TYPES = ("text/markdown", "text/x-markdown", "text/plain")
+_MARKDOWN_EXTENSIONS = (".md", ".mdx", ".txt")
+
+# Maximum number of converted documents kept by fetch_docs
+_DOC_CACHE_MAXSIZE = 256
+# Maximum number of parsed external llms.txt files kept in memory
+_LLMS_CACHE_MAXSIZE = 64
+
 
 class DocSource(TypedDict):
     """A source of documentation for a library or a package."""
@@ -22,17 +55,9 @@ class DocSource(TypedDict):
     """Description of the documentation source (optional)."""
 
 
-def extract_domain(url: str) -> str:
-    """Extract domain from URL.
-
-    Args:
-        url: Full URL
-
-    Returns:
-        Domain with scheme and trailing slash (e.g., https://example.com/)
-    """
-    parsed = urlparse(url)
-    return f"{parsed.scheme}://{parsed.netloc}/"
+def _source_key(source: DocSource) -> str:
+    """Get the key identifying a doc source: its name, or its llms.txt URL."""
+    return source.get("name") or source["llms_txt"]
 
 
 def _is_http_or_https(url: str) -> bool:
@@ -40,46 +65,165 @@ def _is_http_or_https(url: str) -> bool:
     return url.startswith(("http:", "https:"))
 
 
+_FETCH_DESCRIPTION_HEADER = (
+    "Fetch and parse documentation from a given URL or local file.",
+    "",
+    "Use this tool after list_doc_sources to:",
+    "1. First fetch the llms.txt file from a documentation source",
+    "2. Analyze the URLs listed in the llms.txt file",
+    "3. Then fetch specific documentation pages relevant to the user's question",
+    "",
+)
+
+_FETCH_DESCRIPTION_FOOTER = (
+    "",
+    "Returns:",
+    "    The fetched documentation content converted to markdown, or an error message",  # noqa: E501
+    "    if the request fails or the URL is not from an allowed domain.",
+)
+
+# Fetch docs tool descriptions, with and without local sources
+_FETCH_DESCRIPTION_LOCAL = "\n".join(
+    [
+        *_FETCH_DESCRIPTION_HEADER,
+        "Args:",
+        "    url: The URL or file path to fetch documentation from. Can be:",
+        "        - URL from an allowed domain",
+        "        - A local file path (absolute or relative)",
+        "        - A file:// URL (e.g., file:///path/to/llms.txt)",
+        *_FETCH_DESCRIPTION_FOOTER,
+    ]
+)
+
+_FETCH_DESCRIPTION_REMOTE = "\n".join(
+    [
+        *_FETCH_DESCRIPTION_HEADER,
+        "Args:",
+        "    url: The URL to fetch documentation from.",
+        *_FETCH_DESCRIPTION_FOOTER,
+    ]
+)
+
+
 def _get_fetch_description(has_local_sources: bool) -> str:
     """Get fetch docs tool description."""
-    description = [
-        "Fetch and parse documentation from a given URL or local file.",
-        "",
-        "Use this tool after list_doc_sources to:",
-        "1. First fetch the llms.txt file from a documentation source",
-        "2. Analyze the URLs listed in the llms.txt file",
-        "3. Then fetch specific documentation pages relevant to the user's question",
-        "",
-    ]
+    return _FETCH_DESCRIPTION_LOCAL if has_local_sources else _FETCH_DESCRIPTION_REMOTE
 
-    if has_local_sources:
-        description.extend(
-            [
-                "Args:",
-                "    url: The URL or file path to fetch documentation from. Can be:",
-                "        - URL from an allowed domain",
-                "        - A local file path (absolute or relative)",
-                "        - A file:// URL (e.g., file:///path/to/llms.txt)",
-            ]
-        )
-    else:
-        description.extend(
-            [
-                "Args:",
-                "    url: The URL to fetch documentation from.",
-            ]
-        )
 
-    description.extend(
-        [
-            "",
-            "Returns:",
-            "    The fetched documentation content converted to markdown, or an error message",  # noqa: E501
-            "    if the request fails or the URL is not from an allowed domain.",
-        ]
-    )
+def _lru_put(cache: OrderedDict, key: str, value: Any, maxsize: int) -> None:
+    """Insert or refresh an entry of an LRU cache, evicting the oldest if full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
 
-    return "\n".join(description)
+def _conditional_headers(response: httpx.Response) -> dict[str, str]:
+    """Build the headers to revalidate a cached response with the server.
+
+    Returns an empty dict if the response carries neither an ETag nor a
+    Last-Modified header, in which case it cannot be revalidated.
+    """
+    headers = {}
+    if etag := response.headers.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := response.headers.get("last-modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _split_html(html: str, chunk_size: int) -> Iterator[str]:
+    """Split HTML into chunks of at most chunk_size characters.
+
+    Chunks end right after a closing </p> or </div> tag when possible, falling
+    back to the end of any tag, so that elements are rarely cut in half.
+    """
+    start = 0
+    while len(html) - start > chunk_size:
+        limit = start + chunk_size
+        cut = -1
+        for tag in _HTML_BLOCK_ENDS:
+            pos = html.rfind(tag, start, limit)
+            if pos >= 0:
+                cut = max(cut, pos + len(tag))
+        if cut < 0:
+            cut = html.rfind(">", start, limit) + 1 or limit
+        yield html[start:cut]
+        start = cut
+    yield html[start:]
+
+
+def _iter_html_chunks(blocks: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Regroup streamed HTML into chunks of at most chunk_size characters.
+
+    Chunks are cut the same way as in _split_html, so at most about chunk_size
+    characters of the input are buffered at any time.
+    """
+    pending: list[str] = []
+    size = 0
+    for block in blocks:
+        pending.append(block)
+        size += len(block)
+        if size > chunk_size:
+            *chunks, rest = _split_html("".join(pending), chunk_size)
+            yield from chunks
+            pending, size = [rest], len(rest)
+    if size:
+        yield "".join(pending)
+
+
+def _html_to_markdown(html: str, chunk_size: int = _MARKDOWNIFY_CHUNK_SIZE) -> str:
+    """Convert HTML to markdown, chunk by chunk for very large documents.
+
+    Converting in chunks bounds the size of the intermediate parse tree built by
+    markdownify.
+    """
+    if len(html) <= chunk_size:
+        return markdownify(html)
+    return "\n\n".join(markdownify(chunk) for chunk in _split_html(html, chunk_size))
+
+
+def _is_markdown(url: str, content_type: str = "") -> bool:
+    """Check whether a document is already markdown and needs no conversion.
+
+    The content type wins when it is known; otherwise the extension of the URL
+    or file path is used.
+
+    Args:
+        url: URL or file path of the document
+        content_type: Value of the Content-Type header, if any
+    """
+    content_type = content_type.lower()
+    if content_type.startswith(_MARKDOWN_CONTENT_TYPES):
+        return True
+    if content_type.startswith("text/html"):
+        return False
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    return path.lower().endswith(_MARKDOWN_EXTENSIONS)
+
+
+async def _response_to_markdown(response: httpx.Response) -> str:
+    """Get the content of a response as markdown, converting HTML if needed."""
+    if _is_markdown(str(response.url), response.headers.get("content-type", "")):
+        return response.text
+    # markdownify is CPU bound, keep it off the event loop
+    return await asyncio.to_thread(_html_to_markdown, response.text)
+
+
+def _read_local_markdown(path: str) -> str:
+    """Read a local file and convert its content to markdown if needed.
+
+    HTML files are read block by block and converted in chunks, so large files
+    are never loaded and parsed as a whole.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if _is_markdown(path):
+            return f.read()
+        blocks = iter(functools.partial(f.read, _LOCAL_READ_SIZE), "")
+        return "\n\n".join(
+            markdownify(chunk)
+            for chunk in _iter_html_chunks(blocks, _MARKDOWNIFY_CHUNK_SIZE)
+        )
 
 
 def _normalize_path(path: str) -> str:
@@ -98,6 +242,9 @@ def create_server(
     timeout: float = 10,
     settings: dict | None = None,
     allowed_domains: list[str] | None = None,
+    llms_cache_ttl: float = 300,
+    prefetch_remote: bool = False,
+    max_concurrent_requests: int = 32,
 ) -> FastMCP:
     """Create the server and generate documentation retrieval tools.
 
@@ -110,6 +257,15 @@ def create_server(
             Use ['*'] to allow all domains
             The domain hosting the llms.txt file is always appended to the list
             of allowed domains.
+        llms_cache_ttl: How long, in seconds, the URLs parsed from an external
+            llms.txt file are cached before it is fetched again. Use 0 to
+            disable caching.
+        prefetch_remote: Whether to fetch the llms.txt files of all remote
+            sources concurrently to populate the cache. This happens on the
+            server's event loop, the first time an external llms.txt file is
+            requested; a request only waits for the file it asks for.
+        max_concurrent_requests: Maximum number of outbound HTTP requests in
+            flight at once across all tools.
 
     Returns:
         A FastMCP server instance configured with documentation tools
@@ -124,7 +280,27 @@ def create_server(
         ),
         **settings,
     )
-    httpx_client = httpx.AsyncClient(follow_redirects=follow_redirects, timeout=timeout)
+    # A single pooled client is shared by all tools; HTTP/2 lets requests to the
+    # same documentation host be multiplexed over one connection.
+    httpx_client = httpx.AsyncClient(
+        follow_redirects=follow_redirects,
+        timeout=timeout,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=64,
+            max_connections=128,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+    # Bounds outbound requests so that bursts of tool calls cannot exhaust
+    # sockets or trip upstream rate limits
+    fetch_semaphore = asyncio.BoundedSemaphore(max_concurrent_requests)
+
+    async def _get(url: str, **kwargs) -> httpx.Response:
+        """GET a URL with the shared client, within the concurrency bound."""
+        async with fetch_semaphore:
+            return await httpx_client.get(url, **kwargs)
 
     local_sources = []
     remote_sources = []
@@ -137,11 +313,13 @@ def create_server(
             local_sources.append(entry)
 
     # Let's verify that all local sources exist
-    for entry in local_sources:
-        path = entry["llms_txt"]
-        abs_path = _normalize_path(path)
-        if not os.path.exists(abs_path):
-            raise FileNotFoundError(f"Local file not found: {abs_path}")
+    local_paths = [_normalize_path(entry["llms_txt"]) for entry in local_sources]
+    if local_paths:
+        with ThreadPoolExecutor(max_workers=min(32, len(local_paths))) as executor:
+            found = list(executor.map(os.path.exists, local_paths))
+        for abs_path, exists in zip(local_paths, found):
+            if not exists:
+                raise FileNotFoundError(f"Local file not found: {abs_path}")
 
     # Parse the domain names in the llms.txt URLs and identify local file paths
     domains = set(extract_domain(entry["llms_txt"]) for entry in remote_sources)
@@ -153,9 +331,108 @@ def create_server(
         else:
             domains.update(allowed_domains)
 
-    allowed_local_files = set(
-        _normalize_path(entry["llms_txt"]) for entry in local_sources
+    # str.startswith accepts a tuple, checking every prefix in a single call
+    allowed_prefixes = tuple(sorted(domains))
+
+    allowed_local_files = set(local_paths)
+
+    # Index of the doc sources by name for constant time lookups. Sources that
+    # share a name are kept in the order they were added.
+    sources_by_name: dict[str, list[DocSource]] = {}
+    for entry in doc_sources:
+        sources_by_name.setdefault(_source_key(entry), []).append(entry)
+
+    # URL -> (conditional request headers, markdown), in least recently used order
+    doc_cache: OrderedDict[str, tuple[dict[str, str], str]] = OrderedDict()
+
+    # llms.txt URL -> (time fetched, URLs parsed from it)
+    llms_cache: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+
+    # Remote llms.txt files to prefetch, and the tasks fetching them
+    prefetch_urls = (
+        list(dict.fromkeys(entry["llms_txt"] for entry in remote_sources))
+        if prefetch_remote and llms_cache_ttl > 0
+        else []
     )
+    prefetch_tasks: dict[str, asyncio.Task] = {}
+
+    async def _prefetch_llms_txt(llms_txt_url: str) -> None:
+        """Fetch and cache a remote llms.txt file ahead of its first request.
+
+        Failures are ignored; the file is then fetched again when requested.
+        """
+        fetched_at = time.monotonic()
+        try:
+            response = await _get(llms_txt_url)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return
+        urls = parse_llms_urls(response.text, extract_domain(llms_txt_url))
+        _lru_put(llms_cache, llms_txt_url, (fetched_at, urls), _LLMS_CACHE_MAXSIZE)
+
+    async def _ensure_prefetched(llms_txt_url: str) -> None:
+        """Start the prefetch once, on the event loop the server runs on.
+
+        Only a request for a file that is still being prefetched waits for it;
+        every other request proceeds right away.
+        """
+        if prefetch_urls and not prefetch_tasks:
+            for url in prefetch_urls:
+                prefetch_tasks[url] = asyncio.create_task(_prefetch_llms_txt(url))
+        task = prefetch_tasks.get(llms_txt_url)
+        if task is not None and not task.done():
+            # Shielded so that a cancelled tool call does not abort the prefetch
+            # for the calls awaiting it concurrently
+            await asyncio.shield(task)
+
+    async def _stream_llms_urls(
+        llms_txt_url: str, llms_domain: str
+    ) -> AsyncIterator[str]:
+        """Fetch an llms.txt file incrementally, yielding URLs as they are found.
+
+        Consumers may stop iterating early, in which case the rest of the body
+        is never downloaded.
+        """
+        seen: set[str] = set()
+        tail = ""
+        async with fetch_semaphore, httpx_client.stream(
+            "GET", llms_txt_url
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_text(chunk_size=_LLMS_CHUNK_SIZE):
+                scannable, tail = split_scannable(tail + chunk)
+                for url in iter_llms_urls(scannable, llms_domain, seen):
+                    yield url
+        for url in iter_llms_urls(tail, llms_domain, seen):
+            yield url
+
+    async def _iter_llms_txt_urls(
+        llms_txt_url: str, llms_domain: str
+    ) -> AsyncIterator[str]:
+        """Yield the URLs listed in an external llms.txt file, using the cache.
+
+        The parsed URLs are only cached once the body has been read completely,
+        i.e. when the consumer did not stop iterating early.
+        """
+        await _ensure_prefetched(llms_txt_url)
+        cached = llms_cache.get(llms_txt_url)
+        if cached is not None:
+            if time.monotonic() - cached[0] < llms_cache_ttl:
+                llms_cache.move_to_end(llms_txt_url)
+                for url in cached[1]:
+                    yield url
+                return
+            # Drop expired entries so they do not linger until evicted
+            del llms_cache[llms_txt_url]
+
+        fetched_at = time.monotonic()
+        urls = []
+        async with aclosing(_stream_llms_urls(llms_txt_url, llms_domain)) as stream:
+            async for url in stream:
+                urls.append(url)
+                yield url
+        if llms_cache_ttl > 0:
+            _lru_put(llms_cache, llms_txt_url, (fetched_at, urls), _LLMS_CACHE_MAXSIZE)
 
     @server.tool()
     def list_doc_sources() -> str:
@@ -167,18 +444,21 @@ def create_server(
         Returns:
             A string containing a formatted list of documentation sources with their URLs or file paths
         """
-        content = ""
+        parts = []
         for entry_ in doc_sources:
             url_or_path = entry_["llms_txt"]
 
             if _is_http_or_https(url_or_path):
-                name = entry_.get("name", extract_domain(url_or_path))
-                content += f"{name}\nURL: {url_or_path}\n\n"
+                # Only derive the domain when no explicit name is given
+                name = (
+                    entry_["name"] if "name" in entry_ else extract_domain(url_or_path)
+                )
+                parts.append(f"{name}\nURL: {url_or_path}\n\n")
             else:
                 path = _normalize_path(url_or_path)
                 name = entry_.get("name", path)
-                content += f"{name}\nPath: {path}\n\n"
-        return content
+                parts.append(f"{name}\nPath: {path}\n\n")
+        return "".join(parts)
 
     fetch_docs_description = _get_fetch_description(
         has_local_sources=bool(local_sources)
@@ -195,25 +475,36 @@ def create_server(
                     f"Local file not allowed: {abs_path}. Allowed files: {allowed_local_files}"
                 )
             try:
-                with open(abs_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                return markdownify(content)
+                # Reading and converting are blocking, keep them off the event loop
+                return await asyncio.to_thread(_read_local_markdown, abs_path)
             except Exception as e:
                 return f"Error reading local file: {str(e)}"
         else:
             # Otherwise treat as URL
-            if "*" not in domains and not any(
-                url.startswith(domain) for domain in domains
-            ):
+            if "*" not in domains and not url.startswith(allowed_prefixes):
                 return (
                     "Error: URL not allowed. Must start with one of the following domains: "
                     + ", ".join(domains)
                 )
 
             try:
-                response = await httpx_client.get(url, timeout=timeout)
+                # Revalidate previously converted documents instead of
+                # downloading and converting them again
+                cached = doc_cache.get(url)
+                response = await _get(url, headers=cached[0] if cached else None)
+                if cached is not None and response.status_code == 304:
+                    # Re-insert rather than move: a concurrent call may have
+                    # evicted the entry while the request was in flight
+                    _lru_put(doc_cache, url, cached, _DOC_CACHE_MAXSIZE)
+                    return cached[1]
                 response.raise_for_status()
-                return markdownify(response.text)
+                content = await _response_to_markdown(response)
+
+                if headers := _conditional_headers(response):
+                    _lru_put(doc_cache, url, (headers, content), _DOC_CACHE_MAXSIZE)
+                else:
+                    doc_cache.pop(url, None)
+                return content
             except (httpx.HTTPStatusError, httpx.RequestError) as e:
                 return f"Encountered an HTTP error: {str(e)}"
 
@@ -238,49 +529,36 @@ def create_server(
               consider using list_external_docs + fetch_docs for better control.
         """
         try:
-            # First, fetch the llms.txt file to get available URLs
-            response = await httpx_client.get(llms_txt_url, timeout=timeout)
-            response.raise_for_status()
-            llms_content = response.text
-            
             # Extract domain from the llms.txt URL for security
             llms_domain = extract_domain(llms_txt_url)
             
-            # Parse the llms.txt content to find relevant URLs
-            # Handle both plain text and HTML formats
-            import re
-            
-            # First try to extract URLs from HTML links
-            html_urls = re.findall(r'href="([^"]*)"', llms_content)
-            # Also look for URLs in plain text
-            text_urls = re.findall(r'https?://[^\s\)\]]+', llms_content)
+            # If query looks like a URL path, try to find matching URLs
+            is_path_query = query.startswith('/') or query.startswith('http')
             
+            # Stream the llms.txt file and parse available URLs as they arrive
+            # Handle both plain text and HTML formats
             available_urls = []
-            all_found_urls = html_urls + text_urls
-            
-            for url in all_found_urls:
-                # Clean up URLs and filter valid ones
-                url = url.strip().rstrip(')')
-                if url.startswith('http') and url not in available_urls:
-                    # Only include URLs from the same domain for security
-                    if url.startswith(llms_domain):
-                        available_urls.append(url)
+            target_url = None
+            urls = _iter_llms_txt_urls(llms_txt_url, llms_domain)
+            async with aclosing(urls):
+                if is_path_query:
+                    # Match while parsing and stop at the first hit; only the
+                    # first URLs are kept for the error message
+                    async for url in urls:
+                        if len(available_urls) <= 10:
+                            available_urls.append(url)
+                        if query in url:
+                            target_url = url
+                            break
+                else:
+                    available_urls = [url async for url in urls]
             
             if not available_urls:
                 return f"No URLs found in llms.txt file: {llms_txt_url}"
             
-            # If query looks like a URL path, try to find matching URLs
-            if query.startswith('/') or query.startswith('http'):
-                matching_urls = []
-                for url in available_urls:
-                    if query in url:
-                        matching_urls.append(url)
-                
-                if not matching_urls:
+            if is_path_query:
+                if target_url is None:
                     return f"No URLs found matching query '{query}'. Available URLs:\n" + '\n'.join(available_urls[:10]) + ('...' if len(available_urls) > 10 else '')
-                
-                # Fetch the first matching URL
-                target_url = matching_urls[0]
             else:
                 # For text queries, return the llms.txt content and let user choose
                 return f"Available documentation URLs from {llms_txt_url}:\n\n" + '\n'.join(available_urls) + "\n\nPlease use this tool again with a specific URL path from the list above."
@@ -290,10 +568,11 @@ def create_server(
                 return f"Security error: Target URL {target_url} is not from the same domain as llms.txt file {llms_domain}"
             
             # Fetch the target documentation
-            doc_response = await httpx_client.get(target_url, timeout=timeout)
+            doc_response = await _get(target_url)
             doc_response.raise_for_status()
             
-            return f"Documentation from {target_url}:\n\n" + markdownify(doc_response.text)
+            content = await _response_to_markdown(doc_response)
+            return f"Documentation from {target_url}:\n\n" + content
             
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             return f"Error fetching documentation: {str(e)}"
@@ -321,43 +600,33 @@ def create_server(
         Workflow: Use this tool first, then call fetch_docs with your chosen URL.
         """
         try:
-            # Fetch the llms.txt file
-            response = await httpx_client.get(llms_txt_url, timeout=timeout)
-            response.raise_for_status()
-            llms_content = response.text
-            
             # Extract domain for security info
             llms_domain = extract_domain(llms_txt_url)
             
-            # Parse URLs from both HTML and text formats
-            import re
-            html_urls = re.findall(r'href="([^"]*)"', llms_content)
-            text_urls = re.findall(r'https?://[^\s\)\]]+', llms_content)
-            
-            available_urls = []
-            all_found_urls = html_urls + text_urls
-            
-            for url in all_found_urls:
-                url = url.strip().rstrip(')')
-                if url.startswith('http') and url not in available_urls:
-                    if url.startswith(llms_domain):
-                        available_urls.append(url)
+            # Stream the llms.txt file, parsing URLs from both HTML and text formats
+            available_urls = [
+                url async for url in _iter_llms_txt_urls(llms_txt_url, llms_domain)
+            ]
             
             if not available_urls:
                 return f"No documentation URLs found in: {llms_txt_url}"
             
             # Format the response
-            result = f"Available documentation from {llms_txt_url}:\n"
-            result += f"Domain: {llms_domain}\n"
-            result += f"Found {len(available_urls)} documentation URLs:\n\n"
+            result = [
+                f"Available documentation from {llms_txt_url}:\n",
+                f"Domain: {llms_domain}\n",
+                f"Found {len(available_urls)} documentation URLs:\n\n",
+            ]
             
+            domain_length = len(llms_domain)
             for i, url in enumerate(available_urls, 1):
-                # Extract a readable name from the URL
-                url_path = url.replace(llms_domain, '').strip('/')
-                result += f"{i:2d}. {url_path}\n    URL: {url}\n\n"
+                # Extract a readable name from the URL; every URL was filtered
+                # to start with the llms.txt domain
+                url_path = url[domain_length:].strip('/')
+                result.append(f"{i:2d}. {url_path}\n    URL: {url}\n\n")
             
-            result += "Use fetch_docs tool with any of the above URLs to get the content."
-            return result
+            result.append("Use fetch_docs tool with any of the above URLs to get the content.")
+            return "".join(result)
             
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             return f"Error fetching llms.txt file: {str(e)}"
@@ -376,11 +645,11 @@ def create_server(
         Returns:
             Success message or error
         """
-        nonlocal doc_sources, domains
+        nonlocal doc_sources, domains, allowed_prefixes
         
         try:
             # Validate the URL by trying to fetch it
-            response = await httpx_client.get(llms_txt_url, timeout=timeout)
+            response = await _get(llms_txt_url)
             response.raise_for_status()
             
             # Create new doc source
@@ -392,12 +661,14 @@ def create_server(
             
             # Add to doc_sources list
             doc_sources.append(new_source)
+            sources_by_name.setdefault(_source_key(new_source), []).append(new_source)
             
             # Add domain to allowed domains if it's an HTTP URL
             if _is_http_or_https(llms_txt_url):
                 new_domain = extract_domain(llms_txt_url)
                 if "*" not in domains:
                     domains.add(new_domain)
+                    allowed_prefixes = tuple(sorted(domains))
             
             return f"Successfully added documentation source '{name}' with URL: {llms_txt_url}"
             
@@ -411,7 +682,8 @@ def create_server(
         """Remove a documentation source from the server.
         
         Args:
-            name: Name of the documentation source to remove
+            name: Name of the documentation source to remove, or its llms.txt
+                URL if the source has no name
         
         Returns:
             Success message or error
@@ -419,12 +691,22 @@ def create_server(
         nonlocal doc_sources
         
         # Find and remove the source
-        for i, source in enumerate(doc_sources):
-            if source.get("name") == name:
-                removed_source = doc_sources.pop(i)
-                return f"Successfully removed documentation source '{name}' (URL: {removed_source['llms_txt']})"
+        matching_sources = sources_by_name.get(name, [])
+        removed_source = None
+        while matching_sources and removed_source is None:
+            source = matching_sources.pop(0)
+            try:
+                doc_sources.remove(source)
+            except ValueError:
+                # Removed from the caller's list since; drop the stale entry
+                continue
+            removed_source = source
+        if not matching_sources:
+            sources_by_name.pop(name, None)
+        if removed_source is not None:
+            return f"Successfully removed documentation source '{name}' (URL: {removed_source['llms_txt']})"
         
-        available_names = [source.get("name", "unnamed") for source in doc_sources]
+        available_names = list(sources_by_name)
         return f"Documentation source '{name}' not found. Available sources: {', '.join(available_names)}"
 
     return server
@@ -0,0 +1,131 @@
+"""Helpers to parse URLs and llms.txt files."""
+
+import functools
+import re
+from collections.abc import Iterable, Iterator
+from urllib.parse import urlparse
+
+# Characters that terminate a URL once its domain has been located
+_URL_END_RE = re.compile(r"[\s)\]\"'<>]")
+# ASCII characters of _URL_END_RE, after which text can be cut without
+# splitting a URL
+_URL_TERMINATORS = " \t\r\f\v)]\"'<>"
+
+# Upper bound on the unscanned tail carried over between streamed chunks
+_LLMS_MAX_TAIL = 65536
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_domain(url: str) -> str:
+    """Extract domain from URL.
+
+    Results are memoized since the same URLs are seen on every tool call.
+
+    Args:
+        url: Full URL
+
+    Returns:
+        Domain with scheme and trailing slash (e.g., https://example.com/)
+    """
+    sep = url.find("://")
+    if sep < 0:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}/"
+
+    # Fast path: the netloc ends at the first "/", "?" or "#" after the scheme
+    start = sep + 3
+    end = len(url)
+    for delimiter in "/?#":
+        pos = url.find(delimiter, start, end)
+        if pos >= 0:
+            end = pos
+    return url[:sep].lower() + url[sep:end] + "/"
+
+
+def iter_domain_urls(content: str, domain: str) -> Iterator[str]:
+    """Yield the URLs in content that start with the given domain.
+
+    This is a fast path for the common case of looking for URLs on a known
+    domain: occurrences of the domain are located with str.find, and each URL
+    runs until the next whitespace, closing bracket, quote or angle bracket.
+
+    Args:
+        content: Text to scan (plain text, markdown or HTML)
+        domain: Domain with scheme and trailing slash (e.g., https://example.com/)
+
+    Yields:
+        URLs in the order they are found, including duplicates. The content is
+        only scanned as far as the consumer iterates.
+    """
+    find = content.find
+    search_end = _URL_END_RE.search
+    pos = find(domain)
+    while pos >= 0:
+        match = search_end(content, pos)
+        end = match.start() if match else len(content)
+        yield content[pos:end]
+        pos = find(domain, end)
+
+
+def filter_same_domain(
+    urls: Iterable[str], llms_domain: str, seen: set[str]
+) -> Iterator[str]:
+    """Clean up URLs and keep the unique ones on the llms.txt domain.
+
+    Args:
+        urls: Raw URLs found in an llms.txt file
+        llms_domain: Domain of the llms.txt file; only URLs on it are kept.
+        seen: URLs already yielded, updated in place so that duplicates are
+            skipped across calls
+    """
+    for url in urls:
+        url = url.strip().rstrip(")")
+        # Only include URLs from the same domain for security
+        if url.startswith("http") and url.startswith(llms_domain) and url not in seen:
+            seen.add(url)
+            yield url
+
+
+def iter_llms_urls(
+    llms_content: str, llms_domain: str, seen: set[str]
+) -> Iterator[str]:
+    """Yield the documentation URLs found in (a chunk of) an llms.txt file.
+
+    Args:
+        llms_content: Content of the llms.txt file (plain text or HTML)
+        llms_domain: Domain of the llms.txt file; only URLs on it are kept.
+        seen: URLs already yielded, updated in place so that duplicates are
+            skipped across chunks
+    """
+    return filter_same_domain(
+        iter_domain_urls(llms_content, llms_domain), llms_domain, seen
+    )
+
+
+def parse_llms_urls(llms_content: str, llms_domain: str) -> list[str]:
+    """Extract the documentation URLs listed in an llms.txt file.
+
+    Args:
+        llms_content: Content of the llms.txt file (plain text or HTML)
+        llms_domain: Domain of the llms.txt file; only URLs on it are kept.
+
+    Returns:
+        Unique URLs in the order they were found
+    """
+    return list(iter_llms_urls(llms_content, llms_domain, set()))
+
+
+def split_scannable(buffer: str) -> tuple[str, str]:
+    """Split streamed text into complete lines and a trailing partial line.
+
+    URLs never span lines, so the complete lines can be scanned right away while
+    the tail is carried over to the next chunk. A line longer than
+    _LLMS_MAX_TAIL (e.g. a minified HTML index) is instead cut right after its
+    last URL terminator, so that the tail stays bounded without truncating a
+    URL.
+    """
+    cut = buffer.rfind("\n") + 1
+    if cut == 0 and len(buffer) > _LLMS_MAX_TAIL:
+        # Text without any terminator cannot be cut safely, scan it whole
+        cut = max(map(buffer.rfind, _URL_TERMINATORS)) + 1 or len(buffer)
+    return buffer[:cut], buffer[cut:]
@@ -4,13 +4,8 @@
 import asyncio
 import httpx
 from markdownify import markdownify
-from urllib.parse import urlparse
-import re
 
-def extract_domain(url: str) -> str:
-    """Extract domain from URL."""
-    parsed = urlparse(url)
-    return f"{parsed.scheme}://{parsed.netloc}/"
+from mcpdoc.parsing import extract_domain, parse_llms_urls
 
 async def query_structured_outputs():
     """Test querying OpenRouter's Structured Outputs documentation"""
@@ -33,17 +28,7 @@ async def query_structured_outputs():
             llms_domain = extract_domain(llms_txt_url)
             
             # Parse URLs from HTML
-            html_urls = re.findall(r'href="([^"]*)"', llms_content)
-            text_urls = re.findall(r'https?://[^\s\)\]]+', llms_content)
-            
-            available_urls = []
-            all_found_urls = html_urls + text_urls
-            
-            for url in all_found_urls:
-                url = url.strip().rstrip(')')
-                if url.startswith('http') and url not in available_urls:
-                    if url.startswith(llms_domain):
-                        available_urls.append(url)
+            available_urls = parse_llms_urls(llms_content, llms_domain)
             
             print(f"📄 Found {len(available_urls)} documentation URLs")
             
@@ -77,4 +62,10 @@ async def query_structured_outputs():
             print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(query_structured_outputs())
\ No newline at end of file
+    # uvloop is optional (pip install mcpdoc[uvloop]); fall back to the default loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(query_structured_outputs())
+    else:
+        uvloop.run(query_structured_outputs())
\ No newline at end of file
@@ -4,12 +4,8 @@
 import asyncio
 import httpx
 from markdownify import markdownify
-from urllib.parse import urlparse
 
-def extract_domain(url: str) -> str:
-    """Extract domain from URL."""
-    parsed = urlparse(url)
-    return f"{parsed.scheme}://{parsed.netloc}/"
+from mcpdoc.parsing import extract_domain, parse_llms_urls
 
 async def test_query_external_docs():
     """Test the query_external_docs functionality directly"""
@@ -36,21 +32,7 @@ async def test_query_external_docs():
             print(f"\n2. Domain: {llms_domain}")
             
             # Parse URLs - handle both plain text and HTML formats
-            import re
-            
-            # First try to extract URLs from HTML links
-            html_urls = re.findall(r'href="([^"]*)"', llms_content)
-            # Also look for URLs in plain text
-            text_urls = re.findall(r'https?://[^\s\)\]]+', llms_content)
-            
-            available_urls = []
-            all_found_urls = html_urls + text_urls
-            
-            for url in all_found_urls:
-                # Clean up URLs and filter valid ones
-                url = url.strip().rstrip(')')
-                if url.startswith('http') and url not in available_urls:
-                    available_urls.append(url)
+            available_urls = parse_llms_urls(llms_content, llms_domain)
             
             print(f"\n3. Found {len(available_urls)} URLs:")
             for i, url in enumerate(available_urls[:5]):
@@ -87,4 +69,10 @@ async def test_query_external_docs():
             print(f"Error: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(test_query_external_docs())
\ No newline at end of file
+    # uvloop is optional (pip install mcpdoc[uvloop]); fall back to the default loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test_query_external_docs())
+    else:
+        uvloop.run(test_query_external_docs())
\ No newline at end of file
@@ -3,5 +3,6 @@ def test_imports():
     from mcpdoc import main  # noqa
     from mcpdoc import cli  # noqa
     from mcpdoc import langgraph  # noqa
+    from mcpdoc import parsing  # noqa
 
     assert True
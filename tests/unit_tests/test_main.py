@@ -1,30 +1,56 @@
 """Tests for mcpdoc.main module."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
 import pytest
 
 from mcpdoc.main import (
+    DocSource,
     _get_fetch_description,
+    _html_to_markdown,
     _is_http_or_https,
-    extract_domain,
+    _is_markdown,
+    _iter_html_chunks,
+    _split_html,
+    create_server,
 )
 
 
-def test_extract_domain() -> None:
-    """Test extract_domain function."""
-    # Test with https URL
-    assert extract_domain("https://example.com/page") == "https://example.com/"
+class MockHTTP:
+    """Canned HTTP responses for the server's client, keyed by URL."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Callable[[httpx.Request], httpx.Response]] = {}
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        route = self.routes.get(str(request.url))
+        return route(request) if route else httpx.Response(404)
 
-    # Test with http URL
-    assert extract_domain("http://test.org/docs/index.html") == "http://test.org/"
 
-    # Test with URL that has port
-    assert extract_domain("https://localhost:8080/api") == "https://localhost:8080/"
+@pytest.fixture
+def mock_http(monkeypatch) -> MockHTTP:
+    """Route every httpx.AsyncClient created by the server through MockHTTP."""
+    mock = MockHTTP()
+    real_client = httpx.AsyncClient
 
-    # Check trailing slash
-    assert extract_domain("https://localhost:8080") == "https://localhost:8080/"
+    def client_factory(*args, **kwargs) -> httpx.AsyncClient:
+        return real_client(*args, transport=httpx.MockTransport(mock.handler), **kwargs)
 
-    # Test with URL that has subdomain
-    assert extract_domain("https://docs.python.org/3/") == "https://docs.python.org/"
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+    return mock
+
+
+async def _call_tool(server, tool: str, **arguments) -> str:
+    """Call a server tool and return its text output."""
+    result = await server.call_tool(tool, arguments)
+    # Newer mcp versions also return the structured output
+    if isinstance(result, tuple):
+        result = result[0]
+    return result[0].text
 
 
 @pytest.mark.parametrize(
@@ -45,6 +71,61 @@ def test_is_http_or_https(url, expected):
     assert _is_http_or_https(url) is expected
 
 
+@pytest.mark.parametrize(
+    "url,content_type,expected",
+    [
+        ("https://example.com/llms.txt", "", True),
+        ("https://example.com/guide.mdx?version=2", "", True),
+        ("https://example.com/page", "text/markdown; charset=utf-8", True),
+        ("https://example.com/page", "text/plain", True),
+        ("https://example.com/page", "text/html; charset=utf-8", False),
+        # The content type wins over the extension
+        ("https://example.com/page.md", "text/html", False),
+        ("https://example.com/page", "", False),
+        ("/path/to/README.md", "", True),
+    ],
+)
+def test_is_markdown(url, content_type, expected):
+    """Test _is_markdown function."""
+    assert _is_markdown(url, content_type) is expected
+
+
+def test_split_html() -> None:
+    """Test _split_html function."""
+    html = "<div><p>one</p><p>two</p></div><p>three</p>"
+    chunks = list(_split_html(html, 20))
+
+    assert "".join(chunks) == html
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    # Chunks are cut right after a closing block tag
+    assert chunks[0] == "<div><p>one</p>"
+
+    # Small documents are returned as a single chunk
+    assert list(_split_html(html, len(html))) == [html]
+
+
+def test_iter_html_chunks() -> None:
+    """Test _iter_html_chunks function."""
+    html = "".join(f"<p>paragraph {i}</p>" for i in range(10))
+    blocks = [html[i : i + 7] for i in range(0, len(html), 7)]
+    chunks = list(_iter_html_chunks(blocks, 40))
+
+    assert "".join(chunks) == html
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert all(chunk.endswith("</p>") for chunk in chunks)
+
+    # Small inputs come back as a single chunk
+    assert list(_iter_html_chunks(blocks, len(html))) == [html]
+
+
+def test_html_to_markdown_chunked() -> None:
+    """Test that chunked conversion keeps every paragraph."""
+    html = "".join(f"<p>paragraph {i}</p>" for i in range(10))
+    markdown = _html_to_markdown(html, chunk_size=40)
+
+    assert markdown == _html_to_markdown(html)
+
+
 @pytest.mark.parametrize(
     "has_local_sources,expected_substrings",
     [
@@ -69,3 +150,391 @@ def test_get_fetch_description(has_local_sources, expected_substrings):
             # and "file://" are NOT present
             if substring in ["local file path", "file://"]:
                 assert substring not in description
+
+
+async def test_add_and_remove_doc_source(mock_http: MockHTTP) -> None:
+    """Test adding a doc source and removing it by name."""
+    mock_http.routes["https://example.com/llms.txt"] = lambda _: httpx.Response(
+        200, text="# Example"
+    )
+    doc_sources: list[DocSource] = []
+    server = create_server(doc_sources)
+
+    result = await _call_tool(
+        server,
+        "add_doc_source",
+        name="Example",
+        llms_txt_url="https://example.com/llms.txt",
+    )
+    assert "Successfully added" in result
+    assert [source["name"] for source in doc_sources] == ["Example"]
+
+    result = await _call_tool(server, "remove_doc_source", name="Example")
+    assert "Successfully removed" in result
+    assert doc_sources == []
+
+    result = await _call_tool(server, "remove_doc_source", name="Example")
+    assert "not found" in result
+
+
+async def test_remove_doc_source_duplicate_names(mock_http: MockHTTP) -> None:
+    """Test that sources sharing a name are removed one at a time, in order."""
+    doc_sources: list[DocSource] = [
+        {"name": "A", "llms_txt": "https://a.com/llms.txt"},
+        {"name": "A", "llms_txt": "https://b.com/llms.txt"},
+    ]
+    server = create_server(doc_sources)
+
+    result = await _call_tool(server, "remove_doc_source", name="A")
+    assert "https://a.com/llms.txt" in result
+    assert doc_sources == [{"name": "A", "llms_txt": "https://b.com/llms.txt"}]
+
+    result = await _call_tool(server, "remove_doc_source", name="A")
+    assert "https://b.com/llms.txt" in result
+    assert doc_sources == []
+
+    # Adding a source under a name that is already taken is allowed as well
+    mock_http.routes["https://c.com/llms.txt"] = lambda _: httpx.Response(200)
+    for _ in range(2):
+        await _call_tool(
+            server, "add_doc_source", name="C", llms_txt_url="https://c.com/llms.txt"
+        )
+    assert len(doc_sources) == 2
+    await _call_tool(server, "remove_doc_source", name="C")
+    await _call_tool(server, "remove_doc_source", name="C")
+    assert doc_sources == []
+
+
+async def test_remove_unnamed_doc_source(mock_http: MockHTTP) -> None:
+    """Test that sources without a name are removed by their llms.txt URL."""
+    doc_sources: list[DocSource] = [{"llms_txt": "https://a.com/llms.txt"}]
+    server = create_server(doc_sources)
+
+    result = await _call_tool(server, "remove_doc_source", name="missing")
+    assert "Available sources: https://a.com/llms.txt" in result
+
+    result = await _call_tool(
+        server, "remove_doc_source", name="https://a.com/llms.txt"
+    )
+    assert "Successfully removed" in result
+    assert doc_sources == []
+
+    # An empty name falls back to the URL as well
+    mock_http.routes["https://b.com/llms.txt"] = lambda _: httpx.Response(200)
+    await _call_tool(
+        server, "add_doc_source", name="", llms_txt_url="https://b.com/llms.txt"
+    )
+    result = await _call_tool(
+        server, "remove_doc_source", name="https://b.com/llms.txt"
+    )
+    assert "Successfully removed" in result
+    assert doc_sources == []
+
+
+async def test_remove_doc_source_removed_by_caller() -> None:
+    """Test removing a source that was also removed from the caller's list."""
+    doc_sources: list[DocSource] = [
+        {"name": "docs", "llms_txt": "https://a.com/llms.txt"},
+        {"name": "docs", "llms_txt": "https://b.com/llms.txt"},
+    ]
+    server = create_server(doc_sources)
+    del doc_sources[0]
+
+    # The stale entry is skipped, and the next source with the name is removed
+    result = await _call_tool(server, "remove_doc_source", name="docs")
+    assert "https://b.com/llms.txt" in result
+    assert doc_sources == []
+
+    doc_sources.append({"name": "other", "llms_txt": "https://c.com/llms.txt"})
+    server = create_server(doc_sources)
+    doc_sources.clear()
+    result = await _call_tool(server, "remove_doc_source", name="other")
+    assert "Documentation source 'other' not found" in result
+
+
+async def test_fetch_docs_revalidates_cached_documents(mock_http: MockHTTP) -> None:
+    """Test that fetch_docs serves a 304 from its cache and replaces it on 200."""
+    url = "https://example.com/page"
+    responses = iter(
+        [
+            httpx.Response(200, html="<h1>Version 1</h1>", headers={"etag": '"v1"'}),
+            httpx.Response(304),
+            httpx.Response(200, html="<h1>Version 2</h1>", headers={"etag": '"v2"'}),
+            httpx.Response(304),
+        ]
+    )
+    mock_http.routes[url] = lambda _: next(responses)
+    server = create_server([{"llms_txt": "https://example.com/llms.txt"}])
+
+    first = await _call_tool(server, "fetch_docs", url=url)
+    assert "Version 1" in first
+    assert "if-none-match" not in mock_http.requests[-1].headers
+
+    # Not modified: the cached markdown is returned
+    assert await _call_tool(server, "fetch_docs", url=url) == first
+    assert mock_http.requests[-1].headers["if-none-match"] == '"v1"'
+
+    # Modified: the new document replaces the cached one
+    second = await _call_tool(server, "fetch_docs", url=url)
+    assert "Version 2" in second
+    assert await _call_tool(server, "fetch_docs", url=url) == second
+    assert mock_http.requests[-1].headers["if-none-match"] == '"v2"'
+
+
+async def test_fetch_docs_cache_eviction(mock_http: MockHTTP, monkeypatch) -> None:
+    """Test that uncacheable and least recently used documents are dropped."""
+    monkeypatch.setattr("mcpdoc.main._DOC_CACHE_MAXSIZE", 1)
+    mock_http.routes["https://example.com/a"] = lambda _: httpx.Response(
+        200, html="<p>A</p>", headers={"etag": '"a"'}
+    )
+    mock_http.routes["https://example.com/b"] = lambda _: httpx.Response(
+        200, html="<p>B</p>", headers={"last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    )
+    mock_http.routes["https://example.com/c"] = lambda _: httpx.Response(
+        200, html="<p>C</p>"
+    )
+    server = create_server([{"llms_txt": "https://example.com/llms.txt"}])
+
+    # Without validators a document cannot be revalidated, so it is not cached
+    for _ in range(2):
+        await _call_tool(server, "fetch_docs", url="https://example.com/c")
+        assert "if-none-match" not in mock_http.requests[-1].headers
+
+    await _call_tool(server, "fetch_docs", url="https://example.com/a")
+    await _call_tool(server, "fetch_docs", url="https://example.com/b")
+    await _call_tool(server, "fetch_docs", url="https://example.com/b")
+    assert "if-modified-since" in mock_http.requests[-1].headers
+
+    # "a" was evicted when "b" was cached
+    await _call_tool(server, "fetch_docs", url="https://example.com/a")
+    assert "if-none-match" not in mock_http.requests[-1].headers
+
+
+async def test_fetch_docs_cache_entry_evicted_during_revalidation(
+    mock_http: MockHTTP,
+) -> None:
+    """Test a 304 for an entry that a concurrent call dropped from the cache."""
+    url = "https://example.com/page"
+    revalidating = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def route(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(200, html="<p>Cached</p>", headers={"etag": '"v1"'})
+        if calls == 2:
+            revalidating.set()
+            await release.wait()
+            return httpx.Response(304)
+        # A fresh response without validators drops the cache entry
+        return httpx.Response(200, html="<p>Fresh</p>")
+
+    mock_http.routes[url] = route
+    server = create_server([{"llms_txt": "https://example.com/llms.txt"}])
+    cached = await _call_tool(server, "fetch_docs", url=url)
+
+    revalidation = asyncio.create_task(_call_tool(server, "fetch_docs", url=url))
+    await revalidating.wait()
+    assert "Fresh" in await _call_tool(server, "fetch_docs", url=url)
+    release.set()
+
+    assert await revalidation == cached
+
+
+def _llms_txt_route(*urls: str) -> Callable[[httpx.Request], httpx.Response]:
+    return lambda _: httpx.Response(200, text="\n".join(f"- {url}" for url in urls))
+
+
+async def test_list_external_docs_cache(mock_http: MockHTTP) -> None:
+    """Test that llms.txt files are only fetched again once the TTL expired."""
+    llms_txt_url = "https://example.com/llms.txt"
+    mock_http.routes[llms_txt_url] = _llms_txt_route("https://example.com/page")
+    server = create_server([{"llms_txt": llms_txt_url}])
+
+    first = await _call_tool(server, "list_external_docs", llms_txt_url=llms_txt_url)
+    assert "https://example.com/page" in first
+    assert (
+        await _call_tool(server, "list_external_docs", llms_txt_url=llms_txt_url)
+        == first
+    )
+    assert len(mock_http.requests) == 1
+
+
+def _listed_urls(result: str) -> list[str]:
+    """Extract the URLs from the output of list_external_docs."""
+    prefix = "    URL: "
+    return [
+        line[len(prefix) :] for line in result.splitlines() if line.startswith(prefix)
+    ]
+
+
+async def test_list_external_docs_long_single_line(mock_http: MockHTTP) -> None:
+    """Test streaming an llms.txt file without newlines, such as minified HTML."""
+    llms_txt_url = "https://ex.com/llms.txt"
+    urls = [f"https://ex.com/docs/page-{i:05d}" for i in range(3000)]
+    body = "".join(f'<a href="{url}">Page {i}</a>' for i, url in enumerate(urls))
+    # Larger than the tail carried over between chunks
+    assert len(body) > 65536 and "\n" not in body
+    mock_http.routes[llms_txt_url] = lambda _: httpx.Response(200, text=body)
+    server = create_server([{"llms_txt": llms_txt_url}])
+
+    result = await _call_tool(server, "list_external_docs", llms_txt_url=llms_txt_url)
+    assert _listed_urls(result) == urls
+
+
+async def test_list_external_docs_cache_disabled(mock_http: MockHTTP) -> None:
+    """Test that a zero TTL disables the llms.txt cache."""
+    llms_txt_url = "https://example.com/llms.txt"
+    mock_http.routes[llms_txt_url] = _llms_txt_route("https://example.com/page")
+    server = create_server([{"llms_txt": llms_txt_url}], llms_cache_ttl=0)
+
+    for _ in range(2):
+        await _call_tool(server, "list_external_docs", llms_txt_url=llms_txt_url)
+    assert len(mock_http.requests) == 2
+
+
+async def test_list_external_docs_cache_eviction(
+    mock_http: MockHTTP, monkeypatch
+) -> None:
+    """Test that the llms.txt cache keeps a bounded number of files."""
+    monkeypatch.setattr("mcpdoc.main._LLMS_CACHE_MAXSIZE", 1)
+    for host in ("a", "b"):
+        mock_http.routes[f"https://{host}.com/llms.txt"] = _llms_txt_route(
+            f"https://{host}.com/page"
+        )
+    server = create_server([{"llms_txt": "https://a.com/llms.txt"}])
+
+    for host in ("a", "b", "a"):
+        await _call_tool(
+            server, "list_external_docs", llms_txt_url=f"https://{host}.com/llms.txt"
+        )
+    # "a" was evicted when "b" was cached, so it is fetched twice
+    assert [str(request.url) for request in mock_http.requests] == [
+        "https://a.com/llms.txt",
+        "https://b.com/llms.txt",
+        "https://a.com/llms.txt",
+    ]
+
+
+async def test_prefetch_remote(mock_http: MockHTTP) -> None:
+    """Test that remote llms.txt files are prefetched on the server's loop."""
+    release_slow = asyncio.Event()
+
+    async def slow_route(_: httpx.Request) -> httpx.Response:
+        await release_slow.wait()
+        return httpx.Response(200, text="- https://slow.com/page")
+
+    mock_http.routes["https://a.com/llms.txt"] = _llms_txt_route("https://a.com/page")
+    mock_http.routes["https://b.com/llms.txt"] = lambda _: httpx.Response(500)
+    mock_http.routes["https://slow.com/llms.txt"] = slow_route
+    mock_http.routes["https://ex.com/llms.txt"] = _llms_txt_route("https://ex.com/page")
+    server = create_server(
+        [
+            {"llms_txt": "https://a.com/llms.txt"},
+            {"llms_txt": "https://b.com/llms.txt"},
+            {"llms_txt": "https://slow.com/llms.txt"},
+        ],
+        prefetch_remote=True,
+    )
+    # Creating the server inside a running event loop fetches nothing
+    assert mock_http.requests == []
+
+    def list_external_docs(llms_txt_url: str) -> Awaitable[str]:
+        return asyncio.wait_for(
+            _call_tool(server, "list_external_docs", llms_txt_url=llms_txt_url), 5
+        )
+
+    def request_count(url: str) -> int:
+        return [str(request.url) for request in mock_http.requests].count(url)
+
+    # Neither an unrelated file nor a prefetched one waits for the slow source
+    assert "https://ex.com/page" in await list_external_docs("https://ex.com/llms.txt")
+    assert "https://a.com/page" in await list_external_docs("https://a.com/llms.txt")
+    assert not release_slow.is_set()
+    assert request_count("https://a.com/llms.txt") == 1
+
+    # A file still being prefetched is awaited rather than fetched again
+    slow = asyncio.create_task(list_external_docs("https://slow.com/llms.txt"))
+    await asyncio.sleep(0)
+    release_slow.set()
+    assert "https://slow.com/page" in await slow
+    assert request_count("https://slow.com/llms.txt") == 1
+
+    # Files that failed to prefetch are fetched again when requested
+    await list_external_docs("https://b.com/llms.txt")
+    assert request_count("https://b.com/llms.txt") == 2
+
+
+_PAGE_URLS = [f"https://ex.com/docs/page-{i:02d}" for i in range(20)]
+
+
+@pytest.fixture
+def smart_server(mock_http: MockHTTP, monkeypatch):
+    """Server with an llms.txt file streamed in chunks smaller than a line."""
+    monkeypatch.setattr("mcpdoc.main._LLMS_CHUNK_SIZE", 16)
+    mock_http.routes["https://ex.com/llms.txt"] = _llms_txt_route(*_PAGE_URLS)
+    return create_server([{"llms_txt": "https://ex.com/llms.txt"}])
+
+
+async def test_query_external_docs_smart_path_match(
+    smart_server, mock_http: MockHTTP
+) -> None:
+    """Test that a path query fetches the first matching documentation URL."""
+    mock_http.routes["https://ex.com/docs/page-03"] = lambda _: httpx.Response(
+        200, text="# Page 3"
+    )
+    result = await _call_tool(
+        smart_server,
+        "query_external_docs_smart",
+        llms_txt_url="https://ex.com/llms.txt",
+        query="/docs/page-03",
+    )
+    assert result == "Documentation from https://ex.com/docs/page-03:\n\n# Page 3"
+    assert [str(request.url) for request in mock_http.requests] == [
+        "https://ex.com/llms.txt",
+        "https://ex.com/docs/page-03",
+    ]
+
+    # Parsing stopped at the match, so the partial URL list was not cached
+    result = await _call_tool(
+        smart_server, "list_external_docs", llms_txt_url="https://ex.com/llms.txt"
+    )
+    assert _listed_urls(result) == _PAGE_URLS
+    assert len(mock_http.requests) == 3
+
+
+async def test_query_external_docs_smart_path_miss(smart_server) -> None:
+    """Test that a path query without a match previews the first URLs."""
+    result = await _call_tool(
+        smart_server,
+        "query_external_docs_smart",
+        llms_txt_url="https://ex.com/llms.txt",
+        query="/docs/missing",
+    )
+    assert result == (
+        "No URLs found matching query '/docs/missing'. Available URLs:\n"
+        + "\n".join(_PAGE_URLS[:10])
+        + "..."
+    )
+
+
+async def test_query_external_docs_smart_text_query(
+    smart_server, mock_http: MockHTTP
+) -> None:
+    """Test that a text query lists every URL of the llms.txt file."""
+    for _ in range(2):
+        result = await _call_tool(
+            smart_server,
+            "query_external_docs_smart",
+            llms_txt_url="https://ex.com/llms.txt",
+            query="routing",
+        )
+        assert result == (
+            "Available documentation URLs from https://ex.com/llms.txt:\n\n"
+            + "\n".join(_PAGE_URLS)
+            + "\n\nPlease use this tool again with a specific URL path from the list above."
+        )
+    # The complete list is cached
+    assert len(mock_http.requests) == 1
@@ -0,0 +1,98 @@
+"""Tests for mcpdoc.parsing module."""
+
+from mcpdoc.parsing import (
+    extract_domain,
+    iter_domain_urls,
+    parse_llms_urls,
+    split_scannable,
+)
+
+
+def test_extract_domain() -> None:
+    """Test extract_domain function."""
+    # Test with https URL
+    assert extract_domain("https://example.com/page") == "https://example.com/"
+
+    # Test with http URL
+    assert extract_domain("http://test.org/docs/index.html") == "http://test.org/"
+
+    # Test with URL that has port
+    assert extract_domain("https://localhost:8080/api") == "https://localhost:8080/"
+
+    # Check trailing slash
+    assert extract_domain("https://localhost:8080") == "https://localhost:8080/"
+
+    # Test with URL that has subdomain
+    assert extract_domain("https://docs.python.org/3/") == "https://docs.python.org/"
+
+    # Test with query string and fragment but no path
+    assert extract_domain("https://example.com?q=1") == "https://example.com/"
+    assert extract_domain("https://example.com#section") == "https://example.com/"
+
+    # Scheme is normalized to lowercase
+    assert extract_domain("HTTPS://example.com/page") == "https://example.com/"
+
+
+def test_parse_llms_urls() -> None:
+    """Test parse_llms_urls function."""
+    content = (
+        "# Docs\n"
+        "- [Intro](https://example.com/intro)\n"
+        "- [Guide](https://example.com/guide.md): The guide\n"
+        '<a href="https://example.com/api">API</a>\n'
+        "- [Again](https://example.com/intro)\n"
+        "- [Other](https://other.com/page)\n"
+    )
+    urls = parse_llms_urls(content, "https://example.com/")
+
+    assert "https://example.com/intro" in urls
+    assert "https://example.com/guide.md" in urls
+    assert "https://example.com/api" in urls
+    # Duplicates are removed
+    assert urls.count("https://example.com/intro") == 1
+    # The tail of an HTML link is not picked up as a bare URL
+    assert not any('"' in url for url in urls)
+    # URLs from other domains are filtered out
+    assert not any(url.startswith("https://other.com/") for url in urls)
+
+
+def test_iter_domain_urls() -> None:
+    """Test iter_domain_urls function."""
+    content = (
+        "- [A](https://example.com/a)\n"
+        '<a href="https://example.com/b">B</a> '
+        "[https://example.com/c] https://example.com/a\n"
+        "https://other.com/d https://example.com/e"
+    )
+    assert list(iter_domain_urls(content, "https://example.com/")) == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+        "https://example.com/a",
+        "https://example.com/e",
+    ]
+    assert list(iter_domain_urls(content, "https://missing.com/")) == []
+
+    # The scan is lazy and can stop at the first match
+    assert next(iter_domain_urls(content, "https://example.com/")) == (
+        "https://example.com/a"
+    )
+
+
+def test_split_scannable() -> None:
+    """Test split_scannable function."""
+    # Complete lines are scannable, the partial last line is carried over
+    assert split_scannable("https://a.com/x\nhttps://a.com/") == (
+        "https://a.com/x\n",
+        "https://a.com/",
+    )
+    assert split_scannable("line\n") == ("line\n", "")
+
+    # Without any newline the text is carried over until it gets too long, and
+    # is then cut after the last URL terminator
+    assert split_scannable("https://a.com/") == ("", "https://a.com/")
+    long_line = '<a href="https://a.com/x">' * 5000 + '<a href="https://a.com/'
+    assert split_scannable(long_line) == (
+        long_line[: -len("https://a.com/")],
+        "https://a.com/",
+    )